@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import HostNFlyApi, HostNFlyTokens
+from .api import HostNFlyApi, HostNFlyTokens, normalize_host
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_CLIENT,
     CONF_EMAIL,
+    CONF_FIXTURE_LATENCY,
+    CONF_FIXTURE_MODE,
     CONF_HOST,
     CONF_PASSWORD,
     CONF_UID,
+    DEFAULT_FIXTURE_LATENCY,
+    DEFAULT_FIXTURE_MODE,
     DOMAIN,
+    FIXTURES_DIRECTORY,
     PLATFORMS,
 )
 from .coordinator import HostNFlyCoordinator
+from .entity import portfolio_identifier
+from .fixtures import FIXTURE_MODE_OFF, HostNFlyFixtures
+from .ratelimit import async_get_rate_limiter, async_release_rate_limiter
+from .services import async_setup_services, async_unload_services
+from .statistics import HostNFlyStatisticsImporter, async_remove_statistics_store
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -37,11 +50,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         email=entry.data[CONF_EMAIL],
         password=entry.data.get(CONF_PASSWORD),
         tokens=tokens,
+        fixtures=_fixtures(hass, entry),
+        rate_limiter=async_get_rate_limiter(
+            hass, normalize_host(entry.data[CONF_HOST]), entry.data[CONF_EMAIL]
+        ),
     )
     coordinator = HostNFlyCoordinator(hass, api, entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        async_release_rate_limiter(hass, api.rate_limiter, entry.entry_id)
+        raise
 
-    if api.tokens and (
+    replaying = api.fixtures is not None and api.fixtures.replaying
+    if api.tokens and not replaying and (
         CONF_PASSWORD in entry.data or CONF_ACCESS_TOKEN not in entry.data
     ):
         data = {**entry.data}
@@ -51,23 +73,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         data.pop(CONF_PASSWORD, None)
         hass.config_entries.async_update_entry(entry, data=data)
 
+    statistics = HostNFlyStatisticsImporter(hass, coordinator, entry)
+    await statistics.async_load()
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "statistics": statistics,
     }
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
+
+    @callback
+    def _async_remove_stale_devices() -> None:
+        _remove_stale_devices(hass, entry, coordinator)
+
+    _async_remove_stale_devices()
+    entry.async_on_unload(coordinator.async_add_listener(_async_remove_stale_devices))
+
+    @callback
+    def _async_import_statistics() -> None:
+        if coordinator.last_update_success:
+            entry.async_create_background_task(
+                hass, statistics.async_import(), f"{DOMAIN}_import_statistics"
+            )
+
+    _async_import_statistics()
+    entry.async_on_unload(coordinator.async_add_listener(_async_import_statistics))
     return True
 
 
+@callback
+def _remove_stale_devices(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: HostNFlyCoordinator
+) -> None:
+    if not coordinator.last_update_success:
+        return
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        listing_ids = {
+            identifier for domain, identifier in device.identifiers if domain == DOMAIN
+        }
+        listing_ids.discard(portfolio_identifier(entry))
+        if listing_ids and not listing_ids & coordinator.data.keys():
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
+def _fixtures(hass: HomeAssistant, entry: ConfigEntry) -> HostNFlyFixtures | None:
+    mode = entry.options.get(CONF_FIXTURE_MODE, DEFAULT_FIXTURE_MODE)
+    if mode == FIXTURE_MODE_OFF:
+        return None
+    return HostNFlyFixtures(
+        mode,
+        Path(hass.config.path(FIXTURES_DIRECTORY)),
+        replay_latency=entry.options.get(CONF_FIXTURE_LATENCY, DEFAULT_FIXTURE_LATENCY),
+    )
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    await hass.config_entries.async_reload(entry.entry_id)
+    runtime = hass.data[DOMAIN][entry.entry_id]
+    api = runtime["api"]
+    tokens = api.tokens
+    fixtures_mode = api.fixtures.mode if api.fixtures else FIXTURE_MODE_OFF
+    fixtures_latency = api.fixtures.replay_latency if api.fixtures else DEFAULT_FIXTURE_LATENCY
+    if (
+        tokens is None
+        or entry.data.get(CONF_ACCESS_TOKEN) != tokens.access_token
+        or entry.options.get(CONF_FIXTURE_MODE, DEFAULT_FIXTURE_MODE) != fixtures_mode
+        or entry.options.get(CONF_FIXTURE_LATENCY, DEFAULT_FIXTURE_LATENCY) != fixtures_latency
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    await runtime["coordinator"].async_apply_options()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await async_remove_statistics_store(hass, entry)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        runtime = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if runtime:
+            async_release_rate_limiter(hass, runtime["api"].rate_limiter, entry.entry_id)
+        async_unload_services(hass)
     return unload_ok
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    listing_id: str
+    start_date: date
+    end_date: date
+    amount: float | None
+
+
+@dataclass(frozen=True)
+class PeriodStats:
+    start_date: date
+    end_date: date
+    nights: int
+    occupied_nights: int
+    revenue: float
+
+    @property
+    def occupancy_rate(self) -> float | None:
+        if not self.nights:
+            return None
+        return round(100 * self.occupied_nights / self.nights, 1)
+
+
+class _ListingDays:
+    __slots__ = ("occupied", "revenue", "_occupied_prefix", "_revenue_prefix")
+
+    def __init__(self, days: int) -> None:
+        self.occupied = [0] * days
+        self.revenue = [0.0] * days
+        self._occupied_prefix: list[int] | None = None
+        self._revenue_prefix: list[float] | None = None
+
+    def add(self, first: int, last: int, revenue_per_night: float, sign: int) -> None:
+        for offset in range(max(first, 0), min(last, len(self.occupied))):
+            self.occupied[offset] += sign
+            self.revenue[offset] += sign * revenue_per_night
+        self._occupied_prefix = None
+        self._revenue_prefix = None
+
+    def query(self, first: int, last: int) -> tuple[int, float]:
+        if self._occupied_prefix is None or self._revenue_prefix is None:
+            occupied_prefix = [0]
+            revenue_prefix = [0.0]
+            for occupied, revenue in zip(self.occupied, self.revenue):
+                occupied_prefix.append(occupied_prefix[-1] + (1 if occupied > 0 else 0))
+                revenue_prefix.append(revenue_prefix[-1] + revenue)
+            self._occupied_prefix = occupied_prefix
+            self._revenue_prefix = revenue_prefix
+        return (
+            self._occupied_prefix[last] - self._occupied_prefix[first],
+            self._revenue_prefix[last] - self._revenue_prefix[first],
+        )
+
+
+class OccupancyIndex:
+    """Per-night occupancy and revenue arrays, one per listing, over the fetch window."""
+
+    def __init__(self) -> None:
+        self._origin: date | None = None
+        self._days = 0
+        self._entries: dict[str, IndexEntry] = {}
+        self._listing_entries: dict[str, dict[str, IndexEntry]] = {}
+        self._listings: dict[str, _ListingDays] = {}
+
+    def set_window(self, min_date: date, max_date: date) -> None:
+        days = max((max_date - min_date).days, 0)
+        if min_date == self._origin and days == self._days:
+            return
+        self._origin = min_date
+        self._days = days
+        self._listings = {}
+        for entry in self._entries.values():
+            self._apply(entry, 1)
+
+    def sync(self, entries: dict[str, IndexEntry]) -> set[str]:
+        changed_listings: set[str] = set()
+        for key, old_entry in list(self._entries.items()):
+            if entries.get(key) != old_entry:
+                self._apply(old_entry, -1)
+                del self._entries[key]
+                listing_entries = self._listing_entries[old_entry.listing_id]
+                del listing_entries[key]
+                if not listing_entries:
+                    del self._listing_entries[old_entry.listing_id]
+                changed_listings.add(old_entry.listing_id)
+        for key, entry in entries.items():
+            if key in self._entries:
+                continue
+            self._entries[key] = entry
+            self._listing_entries.setdefault(entry.listing_id, {})[key] = entry
+            self._apply(entry, 1)
+            changed_listings.add(entry.listing_id)
+        return changed_listings
+
+    def covers(self, start: date, end: date) -> bool:
+        if self._origin is None:
+            return False
+        return self._origin <= start and end <= self._origin + timedelta(days=self._days)
+
+    def listing_entries(self, listing_id: str) -> list[IndexEntry]:
+        return list(self._listing_entries.get(listing_id, {}).values())
+
+    def stats(self, listing_ids: list[str], start: date, end: date) -> PeriodStats:
+        origin = self._origin
+        if origin is None:
+            return PeriodStats(start, start, 0, 0, 0.0)
+        first = min(max((start - origin).days, 0), self._days)
+        last = min(max((end - origin).days, first), self._days)
+        occupied_nights = 0
+        revenue = 0.0
+        for listing_id in listing_ids:
+            listing_days = self._listings.get(listing_id)
+            if listing_days is None:
+                continue
+            listing_occupied, listing_revenue = listing_days.query(first, last)
+            occupied_nights += listing_occupied
+            revenue += listing_revenue
+        return PeriodStats(
+            start_date=origin + timedelta(days=first),
+            end_date=origin + timedelta(days=last),
+            nights=(last - first) * len(listing_ids),
+            occupied_nights=occupied_nights,
+            revenue=round(revenue, 2),
+        )
+
+    def daily_values(self, listing_id: str, start: date, end: date) -> list[tuple[int, float]]:
+        if self._origin is None:
+            return [(0, 0.0)] * max((end - start).days, 0)
+        listing_days = self._listings.get(listing_id)
+        values: list[tuple[int, float]] = []
+        for offset in range((start - self._origin).days, (end - self._origin).days):
+            if listing_days is None or not 0 <= offset < self._days:
+                values.append((0, 0.0))
+                continue
+            values.append(
+                (1 if listing_days.occupied[offset] > 0 else 0, listing_days.revenue[offset])
+            )
+        return values
+
+    def _apply(self, entry: IndexEntry, sign: int) -> None:
+        if self._origin is None:
+            return
+        listing_days = self._listings.get(entry.listing_id)
+        if listing_days is None:
+            listing_days = self._listings[entry.listing_id] = _ListingDays(self._days)
+        nights = max((entry.end_date - entry.start_date).days, 1)
+        revenue_per_night = (entry.amount or 0.0) / nights
+        first = (entry.start_date - self._origin).days
+        listing_days.add(first, first + nights, revenue_per_night, sign)
@@ -2,11 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+import json
+from time import perf_counter
 from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
 
+from .const import DEFAULT_RATE_BURST, DEFAULT_RATE_LIMIT
+from .fixtures import REDACTED, HostNFlyFixtureNotFound, HostNFlyFixtures
+from .profiling import RefreshProfile, span
+from .ratelimit import PRIORITY_REFRESH, HostNFlyRateLimiter
+
+SIGN_IN_PATH = "/api/v1/auth/sign_in"
+
 
 class HostNFlyApiError(Exception):
     """Generic API error."""
@@ -31,12 +40,18 @@ class HostNFlyApi:
         email: str,
         password: str | None = None,
         tokens: HostNFlyTokens | None = None,
+        fixtures: HostNFlyFixtures | None = None,
+        rate_limiter: HostNFlyRateLimiter | None = None,
     ) -> None:
         self._session = session
         self._email = email
         self._password = password
-        self._host = self._normalize_host(host)
+        self._host = normalize_host(host)
         self._tokens: HostNFlyTokens | None = tokens
+        self.fixtures = fixtures
+        self.rate_limiter = rate_limiter or HostNFlyRateLimiter(
+            DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST
+        )
 
     @property
     def host(self) -> str:
@@ -46,11 +61,6 @@ class HostNFlyApi:
     def tokens(self) -> HostNFlyTokens | None:
         return self._tokens
 
-    def _normalize_host(self, host: str) -> str:
-        if not host.startswith("http"):
-            host = f"https://{host}"
-        return host.rstrip("/")
-
     def _base_headers(self) -> dict[str, str]:
         parsed = urlparse(self._host)
         return {
@@ -80,25 +90,42 @@ class HostNFlyApi:
             "uid": self._tokens.uid,
         }
 
-    async def async_login(self) -> None:
+    async def async_login(self, profile: RefreshProfile | None = None) -> None:
+        if self.fixtures is not None and self.fixtures.replaying:
+            await self._async_replay("POST", SIGN_IN_PATH, None)
+            self._tokens = HostNFlyTokens(access_token=REDACTED, client=REDACTED, uid=REDACTED)
+            return
         if not self._password:
             raise HostNFlyAuthError("Missing credentials")
-        url = f"{self._host}/api/v1/auth/sign_in"
+        url = f"{self._host}{SIGN_IN_PATH}"
         payload = {
             "email": self._email,
             "password": self._password,
             "terms_accepted": False,
             "from": "",
         }
-        async with self._session.post(url, json=payload, headers=self._base_headers()) as resp:
-            if resp.status != 200:
-                raise HostNFlyAuthError(f"Authentication failed: {resp.status}")
-            access_token = resp.headers.get("access-token")
-            client = resp.headers.get("client")
-            uid = resp.headers.get("uid")
-            if not access_token or not client or not uid:
-                raise HostNFlyAuthError("Missing auth headers")
-            self._tokens = HostNFlyTokens(access_token=access_token, client=client, uid=uid)
+        await self.rate_limiter.async_acquire(PRIORITY_REFRESH)
+        start = perf_counter()
+        with span(profile, "network"):
+            async with self._session.post(url, json=payload, headers=self._base_headers()) as resp:
+                if resp.status != 200:
+                    raise HostNFlyAuthError(f"Authentication failed: {resp.status}")
+                access_token = resp.headers.get("access-token")
+                client = resp.headers.get("client")
+                uid = resp.headers.get("uid")
+                if not access_token or not client or not uid:
+                    raise HostNFlyAuthError("Missing auth headers")
+                self._tokens = HostNFlyTokens(access_token=access_token, client=client, uid=uid)
+        if self.fixtures is not None and self.fixtures.recording:
+            await self.fixtures.async_record(
+                "POST",
+                SIGN_IN_PATH,
+                None,
+                200,
+                None,
+                perf_counter() - start,
+                headers=dict(resp.headers),
+            )
 
     async def _request(
         self,
@@ -106,41 +133,103 @@ class HostNFlyApi:
         path: str,
         params: dict[str, Any] | None = None,
         retry_on_auth: bool = True,
+        priority: int = PRIORITY_REFRESH,
+        profile: RefreshProfile | None = None,
     ) -> dict[str, Any]:
+        if self.fixtures is not None and self.fixtures.replaying:
+            return await self._async_replay(method, path, params)
         if not self._tokens:
             if self._password:
-                await self.async_login()
+                await self.async_login(profile)
             else:
                 raise HostNFlyAuthError("Missing tokens")
         url = f"{self._host}{path}"
         headers = {**self._base_headers(), **self._auth_headers()}
-        async with self._session.request(method, url, params=params, headers=headers) as resp:
-            if resp.status in (401, 403) and retry_on_auth:
-                if self._password:
-                    await self.async_login()
-                    return await self._request(method, path, params=params, retry_on_auth=False)
-                raise HostNFlyAuthError(f"Authentication failed: {resp.status}")
-            if resp.status != 200:
-                raise HostNFlyApiError(f"API error: {resp.status}")
-            return await resp.json()
-
-    async def async_get_listings(self) -> list[dict[str, Any]]:
-        data = await self._request("GET", "/api/v1/listings")
+        await self.rate_limiter.async_acquire(priority)
+        start = perf_counter()
+        with span(profile, "network"):
+            async with self._session.request(method, url, params=params, headers=headers) as resp:
+                status = resp.status
+                body = await resp.read() if status == 200 else b""
+        elapsed = perf_counter() - start
+        if status == 200:
+            with span(profile, "decode"):
+                data = json.loads(body)
+        else:
+            data = None
+        if self.fixtures is not None and self.fixtures.recording:
+            await self.fixtures.async_record(method, path, params, status, data, elapsed)
+        if status in (401, 403) and retry_on_auth:
+            if self._password:
+                await self.async_login(profile)
+                return await self._request(
+                    method,
+                    path,
+                    params=params,
+                    retry_on_auth=False,
+                    priority=priority,
+                    profile=profile,
+                )
+            raise HostNFlyAuthError(f"Authentication failed: {status}")
+        if status != 200:
+            raise HostNFlyApiError(f"API error: {status}")
+        return data
+
+    async def _async_replay(
+        self, method: str, path: str, params: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        try:
+            exchange = await self.fixtures.async_replay(method, path, params)
+        except HostNFlyFixtureNotFound as err:
+            raise HostNFlyApiError(str(err)) from err
+        status = exchange["status"]
+        if status in (401, 403):
+            raise HostNFlyAuthError(f"Authentication failed: {status}")
+        if status != 200:
+            raise HostNFlyApiError(f"API error: {status}")
+        return exchange["body"]
+
+    async def async_get_listings(
+        self, profile: RefreshProfile | None = None
+    ) -> list[dict[str, Any]]:
+        data = await self._request("GET", "/api/v1/listings", profile=profile)
         return data.get("listings", [])
 
-    async def async_get_reservations(self, min_date: str, max_date: str) -> list[dict[str, Any]]:
+    async def async_get_reservations(
+        self,
+        min_date: str,
+        max_date: str,
+        priority: int = PRIORITY_REFRESH,
+        profile: RefreshProfile | None = None,
+    ) -> list[dict[str, Any]]:
         params = {
             "min_date": min_date,
             "max_date": max_date,
             "per_page": -1,
         }
-        data = await self._request("GET", "/api/v2/reservations", params=params)
+        data = await self._request(
+            "GET", "/api/v2/reservations", params=params, priority=priority, profile=profile
+        )
         return data.get("reservations", [])
 
-    async def async_get_transfers(self, start_date: date, end_date: date) -> list[dict[str, Any]]:
+    async def async_get_transfers(
+        self,
+        start_date: date,
+        end_date: date,
+        priority: int = PRIORITY_REFRESH,
+        profile: RefreshProfile | None = None,
+    ) -> list[dict[str, Any]]:
         params = {
             "start_date": start_date.strftime("%Y/%m"),
             "end_date": end_date.strftime("%Y/%m"),
         }
-        data = await self._request("GET", "/api/v1/transfers", params=params)
+        data = await self._request(
+            "GET", "/api/v1/transfers", params=params, priority=priority, profile=profile
+        )
         return data.get("transfers", [])
+
+
+def normalize_host(host: str) -> str:
+    if not host.startswith("http"):
+        host = f"https://{host}"
+    return host.rstrip("/")
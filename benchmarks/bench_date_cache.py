@@ -0,0 +1,141 @@
+"""Per-refresh cost of reservation date handling, uncached and with the date cache.
+
+Run from a Home Assistant development environment:
+
+    python benchmarks/bench_date_cache.py --reservations 5000 --distinct-dates 300
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+import importlib.util
+from pathlib import Path
+import random
+import sys
+from timeit import repeat
+
+from homeassistant.util import dt as dt_util
+
+
+def _load_integration():
+    root = Path(__file__).resolve().parent.parent
+    spec = importlib.util.spec_from_file_location(
+        "hostnfly", root / "__init__.py", submodule_search_locations=[str(root)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hostnfly"] = module
+    spec.loader.exec_module(module)
+    return importlib.import_module("hostnfly.coordinator")
+
+
+def _reservations(count: int, listings: int, distinct_dates: int) -> list[dict]:
+    rng = random.Random(0)
+    origin = dt_util.now().date() - timedelta(days=distinct_dates // 2)
+    reservations = []
+    for reservation_id in range(count):
+        start = origin + timedelta(days=rng.randrange(distinct_dates))
+        end = start + timedelta(days=rng.randint(1, 7))
+        # Mix plain dates with datetimes so both parsing paths are exercised.
+        if reservation_id % 2:
+            start_value, end_value = start.isoformat(), end.isoformat()
+        else:
+            start_value, end_value = f"{start.isoformat()}T15:00:00+02:00", f"{end.isoformat()}T11:00:00+02:00"
+        reservations.append(
+            {
+                "id": reservation_id,
+                "listing_id": reservation_id % listings,
+                "start_date": start_value,
+                "end_date": end_value,
+                "amount": "120.5",
+            }
+        )
+    return reservations
+
+
+def _current_uncached(coordinator, reservations: list[dict], now) -> dict | None:
+    # Pre-cache behaviour: parse and build the noon datetime on every call.
+    active = []
+    for reservation in reservations:
+        start_date, end_date = coordinator._reservation_dates(reservation)
+        if not start_date:
+            continue
+        start_dt = coordinator._date_at_noon(start_date, now.tzinfo)
+        if end_date:
+            if start_dt <= now < coordinator._date_at_noon(end_date, now.tzinfo):
+                active.append((start_dt, reservation, end_date, start_date))
+        elif start_dt <= now:
+            active.append((start_dt, reservation, end_date, start_date))
+    if not active:
+        return None
+    _, reservation, end_date, start_date = min(active, key=lambda item: item[0])
+    return coordinator._reservation_details(reservation, start_date, end_date)
+
+
+def _next_uncached(coordinator, reservations: list[dict], now, current: dict | None) -> dict | None:
+    threshold = now
+    if current and current.get("end_date"):
+        threshold = coordinator._date_at_noon(current["end_date"], now.tzinfo)
+    upcoming = []
+    for reservation in reservations:
+        start_date, end_date = coordinator._reservation_dates(reservation)
+        if not start_date:
+            continue
+        start_dt = coordinator._date_at_noon(start_date, now.tzinfo)
+        if start_dt >= threshold:
+            upcoming.append((start_dt, reservation, end_date, start_date))
+    if not upcoming:
+        return None
+    _, reservation, end_date, start_date = min(upcoming, key=lambda item: item[0])
+    return coordinator._reservation_details(reservation, start_date, end_date)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=5000)
+    parser.add_argument("--listings", type=int, default=20)
+    parser.add_argument("--distinct-dates", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    coordinator = _load_integration()
+    reservations = _reservations(args.reservations, args.listings, args.distinct_dates)
+    by_listing = coordinator._group_by_listing(reservations)
+    now = dt_util.now()
+
+    def uncached() -> None:
+        for reservation in reservations:
+            coordinator._index_entry(reservation, None)
+            coordinator._reservation_fingerprint(reservation)
+        for listing_reservations in by_listing.values():
+            current = _current_uncached(coordinator, listing_reservations, now)
+            _next_uncached(coordinator, listing_reservations, now, current)
+
+    def cached() -> None:
+        dates = coordinator._DateCache(now.tzinfo)
+        for reservation in reservations:
+            coordinator._index_entry(reservation, None, dates)
+            coordinator._reservation_fingerprint(reservation, dates)
+        for listing_reservations in by_listing.values():
+            current = coordinator._current_reservation(listing_reservations, now, None, dates)
+            coordinator._next_reservation(listing_reservations, now, current, None, dates)
+
+    for listing_reservations in by_listing.values():
+        current = _current_uncached(coordinator, listing_reservations, now)
+        assert current == coordinator._current_reservation(listing_reservations, now)
+        assert _next_uncached(coordinator, listing_reservations, now, current) == (
+            coordinator._next_reservation(listing_reservations, now, current)
+        )
+
+    baseline = min(repeat(uncached, number=1, repeat=args.repeat))
+    memoized = min(repeat(cached, number=1, repeat=args.repeat))
+    print(
+        f"{args.reservations} reservations, {args.listings} listings, "
+        f"{args.distinct_dates} distinct dates"
+    )
+    print(f"uncached:          {baseline * 1000:.1f} ms per refresh")
+    print(f"with shared cache: {memoized * 1000:.1f} ms per refresh")
+    print(f"saved:             {(baseline - memoized) * 1000:.1f} ms ({1 - memoized / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
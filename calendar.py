@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.util import dt as dt_util
+
+from .api import HostNFlyApiError
+from .const import DOMAIN
+from .coordinator import HostNFlyCoordinator
+from .entity import HostNFlyListingEntity, async_add_listing_entities
+
+RESERVATIONS_CALENDAR = EntityDescription(
+    key="reservations",
+    name="Réservations",
+    icon="mdi:calendar-multiple",
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities,
+) -> None:
+    coordinator: HostNFlyCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    def _listing_calendars(listing_id: str) -> list[HostNFlyCalendar]:
+        return [HostNFlyCalendar(coordinator, entry, listing_id, RESERVATIONS_CALENDAR)]
+
+    async_add_listing_entities(coordinator, entry, async_add_entities, _listing_calendars)
+
+
+class HostNFlyCalendar(HostNFlyListingEntity, CalendarEntity):
+    @property
+    def event(self) -> CalendarEvent | None:
+        data = self._listing_data
+        reservation = data.get("current_reservation") or data.get("next_reservation")
+        if not reservation:
+            return None
+        return _calendar_event(reservation)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        try:
+            reservations = await self.coordinator.async_get_listing_reservations(
+                self._listing_id,
+                dt_util.as_local(start_date).date(),
+                dt_util.as_local(end_date).date(),
+            )
+        except HostNFlyApiError as err:
+            raise HomeAssistantError(f"Erreur API HostNFly: {err}") from err
+        events: list[CalendarEvent] = []
+        for reservation in reservations:
+            event = _calendar_event(reservation)
+            if event.start < end_date and event.end > start_date:
+                events.append(event)
+        return events
+
+
+def _calendar_event(reservation: dict[str, Any]) -> CalendarEvent:
+    start_date: date = reservation["start_date"]
+    end_date: date = reservation.get("end_date") or start_date + timedelta(days=1)
+    tzinfo = dt_util.DEFAULT_TIME_ZONE
+    description = [
+        f"{label}: {reservation[key]}"
+        for key, label in (
+            ("guest_count", "Occupants"),
+            ("source", "Source"),
+            ("amount", "Montant"),
+        )
+        if reservation.get(key) is not None
+    ]
+    reservation_id = reservation.get("reservation_id")
+    return CalendarEvent(
+        start=datetime.combine(start_date, time(12, 0), tzinfo=tzinfo),
+        end=datetime.combine(end_date, time(12, 0), tzinfo=tzinfo),
+        summary=reservation.get("guest_name") or "Réservation",
+        description="\n".join(description) or None,
+        uid=str(reservation_id) if reservation_id is not None else None,
+    )
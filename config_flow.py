@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -11,18 +13,27 @@ from .const import (
     CONF_ACCESS_TOKEN,
     CONF_CLIENT,
     CONF_EMAIL,
+    CONF_FIXTURE_LATENCY,
+    CONF_FIXTURE_MODE,
     CONF_HOST,
     CONF_LOOKAHEAD_DAYS,
     CONF_LOOKBACK_DAYS,
     CONF_PASSWORD,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_SCAN_INTERVAL,
     CONF_UID,
+    DEFAULT_FIXTURE_LATENCY,
+    DEFAULT_FIXTURE_MODE,
     DEFAULT_HOST,
     DEFAULT_LOOKAHEAD_DAYS,
     DEFAULT_LOOKBACK_DAYS,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from .fixtures import FIXTURE_MODES
 
 
 class HostNFlyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -130,7 +141,7 @@ class HostNFlyOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, entry: config_entries.ConfigEntry) -> None:
         self._entry = entry
 
-    async def async_step_init(self, user_input: dict[str, int] | None = None) -> FlowResult:
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
@@ -149,6 +160,22 @@ class HostNFlyOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_LOOKAHEAD_DAYS,
                     default=options.get(CONF_LOOKAHEAD_DAYS, DEFAULT_LOOKAHEAD_DAYS),
                 ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_RATE_LIMIT,
+                    default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_RATE_BURST,
+                    default=options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_FIXTURE_MODE,
+                    default=options.get(CONF_FIXTURE_MODE, DEFAULT_FIXTURE_MODE),
+                ): vol.In(FIXTURE_MODES),
+                vol.Optional(
+                    CONF_FIXTURE_LATENCY,
+                    default=options.get(CONF_FIXTURE_LATENCY, DEFAULT_FIXTURE_LATENCY),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -1,5 +1,5 @@
 DOMAIN = "hostnfly"
-PLATFORMS = ["sensor"]
+PLATFORMS = ["calendar", "sensor"]
 
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
@@ -10,8 +10,39 @@ CONF_UID = "uid"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_LOOKBACK_DAYS = "lookback_days"
 CONF_LOOKAHEAD_DAYS = "lookahead_days"
+CONF_FIXTURE_MODE = "fixture_mode"
+CONF_FIXTURE_LATENCY = "fixture_latency"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
 
 DEFAULT_HOST = "https://api.hostnfly.com"
 DEFAULT_SCAN_INTERVAL = 15
 DEFAULT_LOOKBACK_DAYS = 30
 DEFAULT_LOOKAHEAD_DAYS = 180
+DEFAULT_FIXTURE_MODE = "off"
+DEFAULT_FIXTURE_LATENCY = False
+DEFAULT_RATE_LIMIT = 30
+DEFAULT_RATE_BURST = 10
+
+FIXTURES_DIRECTORY = "hostnfly_fixtures"
+CALENDAR_RANGE_CACHE_SIZE = 12
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+DATE_CACHE_SIZE = 4096
+STATISTICS_BACKFILL_DAYS = 365
+
+EVENT_CHECK_IN = "hostnfly_check_in"
+EVENT_CHECK_OUT = "hostnfly_check_out"
+EVENT_RESERVATION_CREATED = "hostnfly_reservation_created"
+EVENT_RESERVATION_CHANGED = "hostnfly_reservation_changed"
+EVENT_RESERVATION_CANCELLED = "hostnfly_reservation_cancelled"
+
+SERVICE_REFRESH = "refresh"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_LISTING_ID = "listing_id"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_TOP = "top"
+TARGETED_REFRESH_COOLDOWN = 5
+TARGETED_REFRESH_DAYS = 7
+TURNOVER_HORIZON_DAYS = 14
+PROFILE_TOP_DEFAULT = 30
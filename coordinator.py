@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import date, datetime, time, timedelta
 import logging
+from time import monotonic, perf_counter
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .api import HostNFlyApi, HostNFlyAuthError
+from .aggregates import IndexEntry, OccupancyIndex, PeriodStats
+from .api import HostNFlyApi, HostNFlyApiError, HostNFlyAuthError
 from .const import (
+    CALENDAR_RANGE_CACHE_SIZE,
     CONF_LOOKAHEAD_DAYS,
     CONF_LOOKBACK_DAYS,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_SCAN_INTERVAL,
+    DATE_CACHE_SIZE,
     DEFAULT_LOOKAHEAD_DAYS,
     DEFAULT_LOOKBACK_DAYS,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    EVENT_CHECK_IN,
+    EVENT_CHECK_OUT,
+    EVENT_RESERVATION_CANCELLED,
+    EVENT_RESERVATION_CHANGED,
+    EVENT_RESERVATION_CREATED,
+    TARGETED_REFRESH_COOLDOWN,
+    TURNOVER_HORIZON_DAYS,
 )
+from .profiling import RefreshProfile, span
+from .ratelimit import PRIORITY_CALENDAR, PRIORITY_STATISTICS
+from .turnover import ListingTurnovers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +55,36 @@ class HostNFlyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=DOMAIN,
             update_interval=timedelta(minutes=self.scan_interval),
         )
+        api.rate_limiter.configure(entry.entry_id, self.rate_limit, self.rate_burst)
+        self._listings: list[dict[str, Any]] = []
+        self._reservations: dict[str, dict[str, Any]] = {}
+        self._amount_by_reservation_id: dict[str, Any] = {}
+        self._window: tuple[date, date] | None = None
+        self._reservations_by_listing: dict[str, list[dict[str, Any]]] = {}
+        self._range_cache: OrderedDict[
+            tuple[date, date],
+            tuple[float, dict[str, list[dict[str, Any]]], dict[str, Any]],
+        ] = OrderedDict()
+        self._range_requests: dict[tuple[date, date], asyncio.Task] = {}
+        self._occupancy_index = OccupancyIndex()
+        self._history: dict[str, IndexEntry] = {}
+        self._history_range: tuple[date, date] | None = None
+        self.portfolio_stats: dict[str, PeriodStats | None] = {}
+        self._turnovers: dict[str, ListingTurnovers] = {}
+        self.portfolio_turnovers: dict[str, list[str]] = {}
+        self._fingerprints: dict[str, tuple[Any, ...]] | None = None
+        self._fingerprints_window: tuple[date, date] | None = None
+        self._pending_events: list[tuple[str, dict[str, Any]]] = []
+        self._targeted_refresh: tuple[set[str] | None, date, date] | None = None
+        self._targeted_result: asyncio.Future[None] | None = None
+        self._targeted_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TARGETED_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_targeted_refresh,
+        )
+        entry.async_on_unload(self._async_cancel_targeted_refresh)
 
     @property
     def scan_interval(self) -> int:
@@ -46,6 +98,14 @@ class HostNFlyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def lookahead_days(self) -> int:
         return int(self.entry.options.get(CONF_LOOKAHEAD_DAYS, DEFAULT_LOOKAHEAD_DAYS))
 
+    @property
+    def rate_limit(self) -> int:
+        return int(self.entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT))
+
+    @property
+    def rate_burst(self) -> int:
+        return int(self.entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST))
+
     async def _async_update_data(self) -> dict[str, Any]:
         try:
             return await self._async_fetch_data()
@@ -54,40 +114,368 @@ class HostNFlyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             raise UpdateFailed(f"Erreur API HostNFly: {err}") from err
 
-    async def _async_fetch_data(self) -> dict[str, Any]:
+    def _fetch_window(self, today: date) -> tuple[date, date]:
+        return (
+            today - timedelta(days=self.lookback_days),
+            today + timedelta(days=self.lookahead_days),
+        )
+
+    async def _async_fetch_data(self, profile: RefreshProfile | None = None) -> dict[str, Any]:
         now = dt_util.now()
-        today = now.date()
-        min_date = today - timedelta(days=self.lookback_days)
-        max_date = today + timedelta(days=self.lookahead_days)
+        min_date, max_date = self._fetch_window(now.date())
 
-        listings = await self.api.async_get_listings()
-        reservations = await self.api.async_get_reservations(min_date.isoformat(), max_date.isoformat())
+        listings = await self.api.async_get_listings(profile)
+        reservations = await self.api.async_get_reservations(
+            min_date.isoformat(), max_date.isoformat(), profile=profile
+        )
         amount_by_reservation_id: dict[str, Any] = {}
         try:
-            transfers = await self.api.async_get_transfers(min_date, max_date)
+            transfers = await self.api.async_get_transfers(min_date, max_date, profile=profile)
             amount_by_reservation_id = _amounts_by_reservation_id(transfers)
         except Exception as err:
             _LOGGER.debug("Impossible de charger les transferts: %s", err)
 
-        reservations_by_listing: dict[str, list[dict[str, Any]]] = {}
+        with span(profile, "normalize"):
+            self._listings = listings
+            self._reservations = {}
+            for reservation in reservations:
+                self._reservations[_reservation_key(reservation)] = reservation
+            self._amount_by_reservation_id = amount_by_reservation_id
+            self._window = (min_date, max_date)
+        await self._async_sync_history(now.date(), min_date)
+        return self._build_data(now, profile)
+
+    async def async_profile_refresh(self) -> RefreshProfile:
+        profile = RefreshProfile()
+        start = perf_counter()
+        profile.profiler.enable()
+        try:
+            data = await self._async_fetch_data(profile)
+            with span(profile, "render"):
+                self.async_set_updated_data(data)
+        finally:
+            profile.profiler.disable()
+            profile.total = perf_counter() - start
+        return profile
+
+    async def async_apply_options(self) -> None:
+        self.update_interval = timedelta(minutes=self.scan_interval)
+        self.api.rate_limiter.configure(self.entry.entry_id, self.rate_limit, self.rate_burst)
+        if self._window is None:
+            await self.async_request_refresh()
+            return
+
+        now = dt_util.now()
+        min_date, max_date = self._fetch_window(now.date())
+        try:
+            await self._async_resize_window(min_date, max_date)
+            await self._async_sync_history(now.date(), min_date)
+        except HostNFlyAuthError:
+            self.entry.async_start_reauth(self.hass)
+            return
+        except Exception as err:
+            _LOGGER.warning("Impossible d'appliquer la nouvelle fenêtre: %s", err)
+            await self.async_request_refresh()
+            return
+        self.async_set_updated_data(self._build_data(now))
+
+    async def _async_resize_window(self, min_date: date, max_date: date) -> None:
+        old_min, old_max = self._window
+        ranges: list[tuple[date, date]] = []
+        if min_date < old_min:
+            ranges.append((min_date, min(old_min, max_date)))
+        if max_date > old_max:
+            ranges.append((max(old_max, min_date), max_date))
+
+        for range_start, range_end in ranges:
+            reservations = await self.api.async_get_reservations(
+                range_start.isoformat(), range_end.isoformat()
+            )
+            for reservation in reservations:
+                self._reservations[_reservation_key(reservation)] = reservation
+            try:
+                transfers = await self.api.async_get_transfers(range_start, range_end)
+            except Exception as err:
+                _LOGGER.debug("Impossible de charger les transferts: %s", err)
+            else:
+                self._amount_by_reservation_id.update(_amounts_by_reservation_id(transfers))
+
+        self._reservations = {
+            key: reservation
+            for key, reservation in self._reservations.items()
+            if _in_window(reservation, min_date, max_date)
+        }
+        kept_ids = {_reservation_id(reservation) for reservation in self._reservations.values()}
+        self._amount_by_reservation_id = {
+            reservation_id: amount
+            for reservation_id, amount in self._amount_by_reservation_id.items()
+            if reservation_id in kept_ids
+        }
+        self._window = (min_date, max_date)
+
+    async def _async_sync_history(self, today: date, min_date: date) -> None:
+        year_start = today.replace(month=1, day=1)
+        if min_date <= year_start:
+            self._history = {}
+            self._history_range = None
+            return
+        if (
+            self._history_range
+            and self._history_range[0] <= year_start
+            and min_date <= self._history_range[1]
+        ):
+            return
+
+        try:
+            reservations_by_listing, amount_by_reservation_id = await self._async_get_range(
+                year_start, min_date, PRIORITY_STATISTICS
+            )
+        except HostNFlyAuthError:
+            raise
+        except Exception as err:
+            _LOGGER.debug("Impossible de charger les réservations depuis le 1er janvier: %s", err)
+            return
+        history: dict[str, IndexEntry] = {}
+        for reservations in reservations_by_listing.values():
+            for reservation in reservations:
+                entry = _index_entry(reservation, amount_by_reservation_id)
+                if entry is not None:
+                    history[_reservation_key(reservation)] = entry
+        self._history = history
+        self._history_range = _month_range(year_start, min_date)
+
+    async def async_request_targeted_refresh(
+        self, listing_id: str | None, start: date, end: date
+    ) -> None:
+        listing_ids = {listing_id} if listing_id else None
+        if self._targeted_refresh is not None:
+            pending_ids, pending_start, pending_end = self._targeted_refresh
+            if listing_ids is None or pending_ids is None:
+                listing_ids = None
+            else:
+                listing_ids |= pending_ids
+            start = min(start, pending_start)
+            end = max(end, pending_end)
+        self._targeted_refresh = (listing_ids, start, end)
+        if self._targeted_result is None:
+            self._targeted_result = self.hass.loop.create_future()
+        result = self._targeted_result
+        await self._targeted_debouncer.async_call()
+        await asyncio.shield(result)
+
+    async def _async_targeted_refresh(self) -> None:
+        # The debouncer ignores calls while this runs, so batches queued during
+        # a fetch are drained here instead of waiting for another call.
+        while self._targeted_refresh is not None:
+            listing_ids, start, end = self._targeted_refresh
+            result = self._targeted_result
+            self._targeted_refresh = self._targeted_result = None
+            try:
+                await self._async_apply_targeted_refresh(listing_ids, start, end)
+            except HostNFlyAuthError as err:
+                self.entry.async_start_reauth(self.hass)
+                _set_exception(
+                    result, HomeAssistantError(f"Authentification HostNFly requise: {err}")
+                )
+            except Exception as err:
+                _LOGGER.warning("Impossible de rafraîchir les réservations: %s", err)
+                _set_exception(result, HomeAssistantError(f"Erreur API HostNFly: {err}"))
+            else:
+                if result is not None and not result.done():
+                    result.set_result(None)
+
+    @callback
+    def _async_cancel_targeted_refresh(self) -> None:
+        self._targeted_debouncer.async_cancel()
+        result = self._targeted_result
+        self._targeted_refresh = self._targeted_result = None
+        _set_exception(result, HomeAssistantError("Entrée HostNFly déchargée"))
+
+    async def _async_apply_targeted_refresh(
+        self, listing_ids: set[str] | None, start: date, end: date
+    ) -> None:
+        if self._window is None:
+            await self.async_refresh()
+            if not self.last_update_success:
+                raise self.last_exception or UpdateFailed("Rafraîchissement impossible")
+            return
+
+        reservations = await self.api.async_get_reservations(start.isoformat(), end.isoformat())
+        fetched: dict[str, dict[str, Any]] = {}
         for reservation in reservations:
-            if _is_cancelled(reservation):
+            if listing_ids is not None and _reservation_listing_id(reservation) not in listing_ids:
                 continue
-            listing_id = _reservation_listing_id(reservation)
-            if not listing_id:
+            if _in_window(reservation, *self._window):
+                fetched[_reservation_key(reservation)] = reservation
+        for key, reservation in list(self._reservations.items()):
+            if key in fetched:
                 continue
-            reservations_by_listing.setdefault(listing_id, []).append(reservation)
+            if listing_ids is not None and _reservation_listing_id(reservation) not in listing_ids:
+                continue
+            start_date, _ = _reservation_dates(reservation)
+            if start_date and start <= start_date <= end:
+                del self._reservations[key]
+        self._reservations.update(fetched)
+        self.async_set_updated_data(self._build_data(dt_util.now()))
+
+    async def async_get_listing_reservations(
+        self, listing_id: str, start: date, end: date
+    ) -> list[dict[str, Any]]:
+        if self._window and self._window[0] <= start and end <= self._window[1]:
+            reservations = self._reservations_by_listing.get(listing_id, [])
+            amount_by_reservation_id = self._amount_by_reservation_id
+        else:
+            reservations_by_listing, amount_by_reservation_id = await self._async_get_range(
+                start, end, PRIORITY_CALENDAR
+            )
+            reservations = reservations_by_listing.get(listing_id, [])
 
+        details: list[dict[str, Any]] = []
+        for reservation in reservations:
+            start_date, end_date = _reservation_dates(reservation)
+            if not start_date or start_date > end:
+                continue
+            if (end_date or start_date) < start:
+                continue
+            details.append(
+                _reservation_details(reservation, start_date, end_date, amount_by_reservation_id)
+            )
+        details.sort(key=lambda item: item["start_date"])
+        return details
+
+    async def async_get_daily_values(
+        self, start: date, end: date
+    ) -> dict[str, list[tuple[int, float]]]:
+        if self._window and self._window[0] <= start and end <= self._window[1]:
+            index = self._occupancy_index
+        else:
+            reservations_by_listing, amount_by_reservation_id = await self._async_get_range(
+                start, end, PRIORITY_STATISTICS
+            )
+            index = OccupancyIndex()
+            index.set_window(start, end)
+            entries: dict[str, IndexEntry] = {}
+            for reservations in reservations_by_listing.values():
+                for reservation in reservations:
+                    entry = _index_entry(reservation, amount_by_reservation_id)
+                    if entry is not None:
+                        entries[_reservation_key(reservation)] = entry
+            index.sync(entries)
+        return {
+            listing_id: index.daily_values(listing_id, start, end)
+            for listing_id in self.data
+        }
+
+    async def _async_get_range(
+        self, start: date, end: date, priority: int
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, Any]]:
+        range_start, range_end = key = _month_range(start, end)
+        cached = self._range_cache.get(key)
+        if cached and monotonic() - cached[0] < self.update_interval.total_seconds():
+            self._range_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+        task = self._range_requests.get(key)
+        if task is None:
+            task = self.hass.async_create_task(
+                self._async_fetch_range(range_start, range_end, priority)
+            )
+            self._range_requests[key] = task
+            task.add_done_callback(lambda _: self._range_requests.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch_range(
+        self, range_start: date, range_end: date, priority: int
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, Any]]:
+        try:
+            reservations = await self.api.async_get_reservations(
+                range_start.isoformat(), range_end.isoformat(), priority
+            )
+        except HostNFlyApiError:
+            raise
+        except Exception as err:
+            raise HostNFlyApiError(str(err)) from err
+        amount_by_reservation_id: dict[str, Any] = {}
+        try:
+            transfers = await self.api.async_get_transfers(range_start, range_end, priority)
+            amount_by_reservation_id = _amounts_by_reservation_id(transfers)
+        except Exception as err:
+            _LOGGER.debug("Impossible de charger les transferts: %s", err)
+
+        reservations_by_listing = _group_by_listing(reservations)
+        key = (range_start, range_end)
+        self._range_cache[key] = (monotonic(), reservations_by_listing, amount_by_reservation_id)
+        self._range_cache.move_to_end(key)
+        while len(self._range_cache) > CALENDAR_RANGE_CACHE_SIZE:
+            self._range_cache.popitem(last=False)
+        return reservations_by_listing, amount_by_reservation_id
+
+    def _sync_index(self, dates: _DateCache) -> set[str]:
+        entries: dict[str, IndexEntry] = {}
+        if self._window:
+            min_date, max_date = self._window
+            history_range = self._history_range
+            if history_range and history_range[0] < min_date <= history_range[1]:
+                for key, entry in self._history.items():
+                    if entry.end_date < min_date and key not in self._reservations:
+                        entries[key] = entry
+                min_date = history_range[0]
+            self._occupancy_index.set_window(min_date, max_date)
+        for key, reservation in self._reservations.items():
+            entry = _index_entry(reservation, self._amount_by_reservation_id, dates)
+            if entry is not None:
+                entries[key] = entry
+        return self._occupancy_index.sync(entries)
+
+    def _listing_turnovers(self, listing_id: str) -> ListingTurnovers:
+        turnovers = self._turnovers.get(listing_id)
+        if turnovers is None:
+            turnovers = ListingTurnovers(self._occupancy_index.listing_entries(listing_id))
+            self._turnovers[listing_id] = turnovers
+        return turnovers
+
+    def _build_data(self, now: datetime, profile: RefreshProfile | None = None) -> dict[str, Any]:
+        dates = _DateCache(now.tzinfo)
+        with span(profile, "normalize"):
+            reservations_by_listing = _group_by_listing(self._reservations.values())
+            self._reservations_by_listing = reservations_by_listing
+        with span(profile, "index"):
+            for listing_id in self._sync_index(dates):
+                self._turnovers[listing_id] = ListingTurnovers(
+                    self._occupancy_index.listing_entries(listing_id)
+                )
+        with span(profile, "render"):
+            return self._render_data(now, reservations_by_listing, dates)
+
+    def _render_data(
+        self,
+        now: datetime,
+        reservations_by_listing: dict[str, list[dict[str, Any]]],
+        dates: _DateCache,
+    ) -> dict[str, Any]:
+        today = now.date()
+        periods = _stats_periods(today)
+        tomorrow = today + timedelta(days=1)
+        turnovers_today: list[str] = []
+        turnovers_tomorrow: list[str] = []
+
+        amount_by_reservation_id = self._amount_by_reservation_id
         data: dict[str, Any] = {}
-        for listing in listings:
+        for listing in self._listings:
             listing_id = _listing_id(listing)
             if not listing_id:
                 continue
             listing_reservations = reservations_by_listing.get(listing_id, [])
+            turnovers = self._listing_turnovers(listing_id)
+            if turnovers.count(today, tomorrow):
+                turnovers_today.append(listing_id)
+            if turnovers.count(tomorrow, tomorrow + timedelta(days=1)):
+                turnovers_tomorrow.append(listing_id)
             current_reservation = _current_reservation(
                 listing_reservations,
                 now,
                 amount_by_reservation_id,
+                dates,
             )
             data[listing_id] = {
                 "listing": listing,
@@ -98,11 +486,207 @@ class HostNFlyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     now,
                     current_reservation,
                     amount_by_reservation_id,
+                    dates,
+                ),
+                "stats": {
+                    period: self._period_stats([listing_id], start, end)
+                    for period, (start, end) in periods.items()
+                },
+                "next_turnover": turnovers.next_window(today),
+                "same_day_turnovers": turnovers.same_day_count(
+                    today, today + timedelta(days=TURNOVER_HORIZON_DAYS)
                 ),
             }
 
+        self.portfolio_stats = {
+            period: self._period_stats(list(data), start, end)
+            for period, (start, end) in periods.items()
+        }
+        self.portfolio_turnovers = {
+            "today": turnovers_today,
+            "tomorrow": turnovers_tomorrow,
+        }
+        self._pending_events.extend(self._diff_reservations(data, today, dates))
         return data
 
+    def _period_stats(
+        self, listing_ids: list[str], start: date, end: date
+    ) -> PeriodStats | None:
+        if not self._occupancy_index.covers(start, end):
+            return None
+        return self._occupancy_index.stats(listing_ids, start, end)
+
+    def _diff_reservations(
+        self, data: dict[str, Any], today: date, dates: _DateCache
+    ) -> list[tuple[str, dict[str, Any]]]:
+        fingerprints = {
+            key: _reservation_fingerprint(reservation, dates)
+            for key, reservation in self._reservations.items()
+        }
+        previous, self._fingerprints = self._fingerprints, fingerprints
+        previous_window, self._fingerprints_window = self._fingerprints_window, self._window
+        previous_data = self.data
+        if previous is None or previous_data is None:
+            return []
+
+        events: list[tuple[str, dict[str, Any]]] = []
+        for key, fingerprint in fingerprints.items():
+            reservation = self._reservations[key]
+            old_fingerprint = previous.get(key)
+            if old_fingerprint is None:
+                if _is_cancelled(reservation):
+                    continue
+                if previous_window and not _in_window(reservation, *previous_window):
+                    continue
+                event_type = EVENT_RESERVATION_CREATED
+            elif old_fingerprint == fingerprint:
+                continue
+            elif _is_cancelled(reservation):
+                if old_fingerprint[0]:
+                    continue
+                event_type = EVENT_RESERVATION_CANCELLED
+            else:
+                event_type = EVENT_RESERVATION_CHANGED
+            start_date, end_date = _reservation_dates(reservation, dates)
+            events.append(
+                (
+                    event_type,
+                    self._event_data(
+                        _reservation_listing_id(reservation),
+                        _reservation_id(reservation),
+                        start_date,
+                        end_date,
+                    ),
+                )
+            )
+
+        if self._window:
+            min_date, max_date = self._window
+            for key, old_fingerprint in previous.items():
+                if key in fingerprints or old_fingerprint[0]:
+                    continue
+                _, listing_id, start_date, end_date = old_fingerprint[:4]
+                if not start_date or start_date > max_date or (end_date and end_date < min_date):
+                    continue
+                events.append(
+                    (
+                        EVENT_RESERVATION_CANCELLED,
+                        self._event_data(listing_id, key, start_date, end_date),
+                    )
+                )
+
+        cancelled_ids = {
+            event_data["reservation_id"]
+            for event_type, event_data in events
+            if event_type == EVENT_RESERVATION_CANCELLED
+        }
+        for listing_id, listing_data in data.items():
+            if listing_id not in previous_data:
+                continue
+            old_current = previous_data[listing_id].get("current_reservation")
+            new_current = listing_data["current_reservation"]
+            old_id = old_current.get("reservation_id") if old_current else None
+            new_id = new_current.get("reservation_id") if new_current else None
+            if (
+                old_current
+                and (not new_current or old_id != new_id)
+                and old_current.get("end_date")
+                and old_current["end_date"] <= today
+                and (old_id is None or str(old_id) not in cancelled_ids)
+            ):
+                events.append((EVENT_CHECK_OUT, self._reservation_event_data(listing_id, old_current)))
+            if new_current and (not old_current or old_id != new_id):
+                events.append((EVENT_CHECK_IN, self._reservation_event_data(listing_id, new_current)))
+        return events
+
+    def _reservation_event_data(
+        self, listing_id: str, reservation: dict[str, Any]
+    ) -> dict[str, Any]:
+        reservation_id = reservation.get("reservation_id")
+        return self._event_data(
+            listing_id,
+            str(reservation_id) if reservation_id is not None else None,
+            reservation.get("start_date"),
+            reservation.get("end_date"),
+        )
+
+    def _event_data(
+        self,
+        listing_id: str | None,
+        reservation_id: str | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> dict[str, Any]:
+        return {
+            "entry_id": self.entry.entry_id,
+            "listing_id": listing_id,
+            "reservation_id": reservation_id,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        events, self._pending_events = self._pending_events, []
+        for event_type, event_data in events:
+            self.hass.bus.async_fire(event_type, event_data)
+
+
+def _set_exception(result: asyncio.Future[None] | None, err: Exception) -> None:
+    if result is not None and not result.done():
+        result.set_exception(err)
+
+
+def _group_by_listing(
+    reservations: Iterable[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    reservations_by_listing: dict[str, list[dict[str, Any]]] = {}
+    for reservation in reservations:
+        if _is_cancelled(reservation):
+            continue
+        listing_id = _reservation_listing_id(reservation)
+        if not listing_id:
+            continue
+        reservations_by_listing.setdefault(listing_id, []).append(reservation)
+    return reservations_by_listing
+
+
+def _stats_periods(today: date) -> dict[str, tuple[date, date]]:
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return {
+        "current_month": (month_start, next_month_start),
+        "next_30_days": (today, today + timedelta(days=30)),
+        "year_to_date": (today.replace(month=1, day=1), today + timedelta(days=1)),
+    }
+
+
+def _month_range(start: date, end: date) -> tuple[date, date]:
+    return start.replace(day=1), (end.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _index_entry(
+    reservation: dict[str, Any],
+    amount_by_reservation_id: dict[str, Any] | None,
+    dates: _DateCache | None = None,
+) -> IndexEntry | None:
+    if _is_cancelled(reservation):
+        return None
+    listing_id = _reservation_listing_id(reservation)
+    start_date, end_date = _reservation_dates(reservation, dates)
+    if not listing_id or not start_date:
+        return None
+    amount = _reservation_amount(reservation)
+    if amount is None:
+        amount = _reservation_amount_from_map(reservation, amount_by_reservation_id)
+    return IndexEntry(
+        listing_id=listing_id,
+        start_date=start_date,
+        end_date=end_date or start_date + timedelta(days=1),
+        amount=amount,
+    )
+
 
 def _listing_id(listing: dict[str, Any]) -> str | None:
     for key in ("id", "listing_id", "uid", "uuid"):
@@ -132,6 +716,15 @@ def _reservation_id(reservation: dict[str, Any]) -> str | None:
     return None
 
 
+def _reservation_key(reservation: dict[str, Any]) -> str:
+    reservation_id = _reservation_id(reservation)
+    if reservation_id:
+        return reservation_id
+    start_value = reservation.get("start_date") or reservation.get("check_in")
+    end_value = reservation.get("end_date") or reservation.get("check_out")
+    return f"{_reservation_listing_id(reservation)}:{start_value}:{end_value}"
+
+
 def _parse_date(value: Any) -> date | None:
     if not value:
         return None
@@ -151,10 +744,67 @@ def _date_at_noon(value: date, tzinfo) -> datetime:
     return datetime.combine(value, time(12, 0), tzinfo=tzinfo)
 
 
-def _reservation_dates(reservation: dict[str, Any]) -> tuple[date | None, date | None]:
+class _DateCache:
+    """Bounded string->date and date->noon memo, scoped to one refresh and timezone."""
+
+    def __init__(self, tzinfo, maxsize: int = DATE_CACHE_SIZE) -> None:
+        self.tzinfo = tzinfo
+        self._maxsize = maxsize
+        self._dates: dict[str, date | None] = {}
+        self._noons: dict[date, datetime] = {}
+
+    def parse(self, value: Any) -> date | None:
+        if not isinstance(value, str):
+            return _parse_date(value)
+        try:
+            return self._dates[value]
+        except KeyError:
+            parsed = _parse_date(value)
+            if len(self._dates) < self._maxsize:
+                self._dates[value] = parsed
+            return parsed
+
+    def noon(self, value: date) -> datetime:
+        try:
+            return self._noons[value]
+        except KeyError:
+            noon = _date_at_noon(value, self.tzinfo)
+            if len(self._noons) < self._maxsize:
+                self._noons[value] = noon
+            return noon
+
+
+def _reservation_dates(
+    reservation: dict[str, Any], dates: _DateCache | None = None
+) -> tuple[date | None, date | None]:
     start_value = reservation.get("start_date") or reservation.get("check_in")
     end_value = reservation.get("end_date") or reservation.get("check_out")
-    return _parse_date(start_value), _parse_date(end_value)
+    parse = dates.parse if dates is not None else _parse_date
+    return parse(start_value), parse(end_value)
+
+
+def _reservation_fingerprint(
+    reservation: dict[str, Any], dates: _DateCache | None = None
+) -> tuple[Any, ...]:
+    start_date, end_date = _reservation_dates(reservation, dates)
+    return (
+        _is_cancelled(reservation),
+        _reservation_listing_id(reservation),
+        start_date,
+        end_date,
+        _reservation_guest_name(reservation),
+        _reservation_guest_count(reservation),
+        _reservation_amount(reservation),
+    )
+
+
+def _in_window(reservation: dict[str, Any], min_date: date, max_date: date) -> bool:
+    start_date, end_date = _reservation_dates(reservation)
+    if start_date and start_date > max_date:
+        return False
+    if end_date and end_date < min_date:
+        return False
+    return True
 
 
 def _reservation_guest_name(reservation: dict[str, Any]) -> str | None:
@@ -317,24 +967,48 @@ def _is_occupied(reservations: list[dict[str, Any]], today: date) -> bool:
     return False
 
 
+def _reservation_details(
+    reservation: dict[str, Any],
+    start_date: date,
+    end_date: date | None,
+    amount_by_reservation_id: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    amount = _reservation_amount(reservation)
+    if amount is None:
+        amount = _reservation_amount_from_map(reservation, amount_by_reservation_id)
+    return {
+        "reservation_id": reservation.get("id"),
+        "guest_name": _reservation_guest_name(reservation),
+        "guest_count": _reservation_guest_count(reservation),
+        "guest_profile_url": _reservation_guest_profile_url(reservation),
+        "source": reservation.get("source"),
+        "amount": amount,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+
 def _next_reservation(
     reservations: list[dict[str, Any]],
     now: datetime,
     current_reservation: dict[str, Any] | None,
     amount_by_reservation_id: dict[str, Any] | None = None,
+    dates: _DateCache | None = None,
 ) -> dict[str, Any] | None:
+    if dates is None or dates.tzinfo is not now.tzinfo:
+        dates = _DateCache(now.tzinfo)
     threshold = now
     if current_reservation:
         end_date = current_reservation.get("end_date")
         if isinstance(end_date, date):
-            threshold = _date_at_noon(end_date, now.tzinfo)
+            threshold = dates.noon(end_date)
 
     upcoming: list[tuple[datetime, dict[str, Any], date | None, date]] = []
     for reservation in reservations:
-        start_date, end_date = _reservation_dates(reservation)
+        start_date, end_date = _reservation_dates(reservation, dates)
         if not start_date:
             continue
-        start_dt = _date_at_noon(start_date, now.tzinfo)
+        start_dt = dates.noon(start_date)
         if start_dt < threshold:
             continue
         upcoming.append((start_dt, reservation, end_date, start_date))
@@ -342,34 +1016,25 @@ def _next_reservation(
         return None
 
     _, reservation, end_date, start_date = min(upcoming, key=lambda item: item[0])
-    amount = _reservation_amount(reservation)
-    if amount is None:
-        amount = _reservation_amount_from_map(reservation, amount_by_reservation_id)
-    return {
-        "reservation_id": reservation.get("id"),
-        "guest_name": _reservation_guest_name(reservation),
-        "guest_count": _reservation_guest_count(reservation),
-        "guest_profile_url": _reservation_guest_profile_url(reservation),
-        "source": reservation.get("source"),
-        "amount": amount,
-        "start_date": start_date,
-        "end_date": end_date,
-    }
+    return _reservation_details(reservation, start_date, end_date, amount_by_reservation_id)
 
 
 def _current_reservation(
     reservations: list[dict[str, Any]],
     now: datetime,
     amount_by_reservation_id: dict[str, Any] | None = None,
+    dates: _DateCache | None = None,
 ) -> dict[str, Any] | None:
+    if dates is None or dates.tzinfo is not now.tzinfo:
+        dates = _DateCache(now.tzinfo)
     active: list[tuple[datetime, dict[str, Any], date | None, date]] = []
     for reservation in reservations:
-        start_date, end_date = _reservation_dates(reservation)
+        start_date, end_date = _reservation_dates(reservation, dates)
         if not start_date:
             continue
-        start_dt = _date_at_noon(start_date, now.tzinfo)
+        start_dt = dates.noon(start_date)
         if end_date:
-            end_dt = _date_at_noon(end_date, now.tzinfo)
+            end_dt = dates.noon(end_date)
             if start_dt <= now < end_dt:
                 active.append((start_dt, reservation, end_date, start_date))
         elif start_dt <= now:
@@ -377,16 +1042,4 @@ def _current_reservation(
     if not active:
         return None
     _, reservation, end_date, start_date = min(active, key=lambda item: item[0])
-    amount = _reservation_amount(reservation)
-    if amount is None:
-        amount = _reservation_amount_from_map(reservation, amount_by_reservation_id)
-    return {
-        "reservation_id": reservation.get("id"),
-        "guest_name": _reservation_guest_name(reservation),
-        "guest_count": _reservation_guest_count(reservation),
-        "guest_profile_url": _reservation_guest_profile_url(reservation),
-        "source": reservation.get("source"),
-        "amount": amount,
-        "start_date": start_date,
-        "end_date": end_date,
-    }
+    return _reservation_details(reservation, start_date, end_date, amount_by_reservation_id)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ACCESS_TOKEN, CONF_CLIENT, CONF_EMAIL, CONF_PASSWORD, CONF_UID, DOMAIN
+
+TO_REDACT = {CONF_ACCESS_TOKEN, CONF_CLIENT, CONF_EMAIL, CONF_PASSWORD, CONF_UID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    runtime = hass.data[DOMAIN][entry.entry_id]
+    api = runtime["api"]
+    coordinator = runtime["coordinator"]
+    fixtures = api.fixtures
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "listings": len(coordinator.data or {}),
+        "rate_limiter": api.rate_limiter.usage(),
+        "fixtures": {
+            "mode": fixtures.mode if fixtures else None,
+            "capture": list(fixtures.capture) if fixtures else [],
+        },
+    }
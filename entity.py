@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import HostNFlyCoordinator
+
+
+class HostNFlyListingEntity(CoordinatorEntity[HostNFlyCoordinator]):
+    def __init__(
+        self,
+        coordinator: HostNFlyCoordinator,
+        entry: ConfigEntry,
+        listing_id: str,
+        description: EntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._listing_id = listing_id
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_{listing_id}_{description.key}"
+        self._attr_has_entity_name = True
+        self._attr_name = description.name
+
+        listing = coordinator.data.get(listing_id, {}).get("listing", {})
+        listing_name = str(listing.get("name") or listing.get("title") or f"Listing {listing_id}")
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, listing_id)},
+            name=listing_name,
+            manufacturer="HostNFly",
+        )
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._listing_id in self.coordinator.data
+
+    @property
+    def _listing_data(self) -> dict[str, Any]:
+        return self.coordinator.data.get(self._listing_id, {})
+
+
+class HostNFlyPortfolioEntity(CoordinatorEntity[HostNFlyCoordinator]):
+    def __init__(
+        self,
+        coordinator: HostNFlyCoordinator,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_portfolio_{description.key}"
+        self._attr_has_entity_name = True
+        self._attr_name = description.name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, portfolio_identifier(entry))},
+            name=f"HostNFly {entry.title}",
+            manufacturer="HostNFly",
+        )
+
+
+def portfolio_identifier(entry: ConfigEntry) -> str:
+    return f"{entry.entry_id}_portfolio"
+
+
+@callback
+def async_add_listing_entities(
+    coordinator: HostNFlyCoordinator,
+    entry: ConfigEntry,
+    async_add_entities,
+    entity_factory: Callable[[str], Iterable[Entity]],
+) -> None:
+    known_listing_ids: set[str] = set()
+
+    @callback
+    def _async_add_new_listings() -> None:
+        known_listing_ids.intersection_update(coordinator.data)
+        new_listing_ids = [
+            listing_id for listing_id in coordinator.data if listing_id not in known_listing_ids
+        ]
+        if not new_listing_ids:
+            return
+        known_listing_ids.update(new_listing_ids)
+        entities: list[Entity] = []
+        for listing_id in new_listing_ids:
+            entities.extend(entity_factory(listing_id))
+        async_add_entities(entities)
+
+    _async_add_new_listings()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_listings))
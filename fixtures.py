@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+FIXTURE_MODE_OFF = "off"
+FIXTURE_MODE_RECORD = "record"
+FIXTURE_MODE_REPLAY = "replay"
+FIXTURE_MODES = (FIXTURE_MODE_OFF, FIXTURE_MODE_RECORD, FIXTURE_MODE_REPLAY)
+
+REDACTED = "**REDACTED**"
+
+_PII_KEYS = {"airbnb_url", "guest_profile_url", "profile_url"}
+_PII_KEY_PARTS = ("email", "phone", "address", "first_name", "last_name", "full_name", "guest_name")
+_GUEST_KEYS = {"guest", "guests", "traveler", "travelers"}
+_TOKEN_HEADERS = ("access-token", "client", "uid")
+
+MAX_CAPTURE = 50
+
+
+class HostNFlyFixtureNotFound(Exception):
+    """No recorded exchange matches the request."""
+
+
+class HostNFlyFixtures:
+    def __init__(self, mode: str, directory: Path, replay_latency: bool = False) -> None:
+        self.mode = mode
+        self._directory = directory
+        self.replay_latency = replay_latency
+        self._recorded: dict[str, dict[str, Any]] | None = None
+        self.capture: list[dict[str, Any]] = []
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == FIXTURE_MODE_RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == FIXTURE_MODE_REPLAY
+
+    async def async_record(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        status: int,
+        body: Any,
+        elapsed: float,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        exchange = {
+            "method": method,
+            "path": path,
+            "params": params or {},
+            "status": status,
+            "headers": {
+                key.lower(): REDACTED for key in headers or {} if key.lower() in _TOKEN_HEADERS
+            },
+            "body": scrub(body),
+            "elapsed": round(elapsed, 4),
+        }
+        self.capture.append(exchange)
+        del self.capture[:-MAX_CAPTURE]
+        await asyncio.get_running_loop().run_in_executor(None, self._write, exchange)
+
+    async def async_replay(
+        self, method: str, path: str, params: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        if self._recorded is None:
+            self._recorded = await asyncio.get_running_loop().run_in_executor(None, self._load)
+        exchange = self._recorded.get(_exchange_key(method, path, params)) or self._recorded.get(
+            _exchange_key(method, path, None)
+        )
+        if exchange is None:
+            raise HostNFlyFixtureNotFound(f"No fixture for {method} {path}")
+        if self.replay_latency and exchange.get("elapsed"):
+            await asyncio.sleep(exchange["elapsed"])
+        return exchange
+
+    def _write(self, exchange: dict[str, Any]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        key = _exchange_key(exchange["method"], exchange["path"], exchange["params"])
+        text = json.dumps(exchange, ensure_ascii=False, indent=2, default=str)
+        (self._directory / f"{key}.json").write_text(text, encoding="utf-8")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        recorded: dict[str, dict[str, Any]] = {}
+        if not self._directory.is_dir():
+            return recorded
+        for fixture_path in sorted(self._directory.glob("*.json"), key=lambda item: item.stat().st_mtime):
+            exchange = json.loads(fixture_path.read_text(encoding="utf-8"))
+            method, path, params = exchange["method"], exchange["path"], exchange.get("params")
+            recorded[_exchange_key(method, path, params)] = exchange
+            recorded[_exchange_key(method, path, None)] = exchange
+        return recorded
+
+
+def scrub(value: Any, redact: bool = False, guest: bool = False) -> Any:
+    if isinstance(value, list):
+        return [scrub(item, redact, guest) for item in value]
+    if isinstance(value, dict):
+        scrubbed: dict[str, Any] = {}
+        for key, item in value.items():
+            key_name = str(key).lower()
+            guest_key = key_name in _GUEST_KEYS
+            if guest_key and isinstance(item, str):
+                scrubbed[key] = REDACTED
+            else:
+                scrubbed[key] = scrub(
+                    item, redact or _is_pii_key(key_name, guest), guest or guest_key
+                )
+        return scrubbed
+    if redact and isinstance(value, str):
+        return REDACTED
+    return value
+
+
+def _is_pii_key(key: str, guest: bool) -> bool:
+    return (
+        key in _PII_KEYS
+        or any(part in key for part in _PII_KEY_PARTS)
+        or (guest and "name" in key)
+    )
+
+
+def _exchange_key(method: str, path: str, params: dict[str, Any] | None) -> str:
+    slug = path.strip("/").replace("/", "_")
+    if params is None:
+        return f"{method.lower()}_{slug}"
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode(), usedforsecurity=False
+    ).hexdigest()[:10]
+    return f"{method.lower()}_{slug}_{digest}"
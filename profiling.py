@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+import cProfile
+import io
+from pathlib import Path
+import pstats
+from time import perf_counter
+
+SPAN_NAMES = ("network", "decode", "normalize", "index", "render")
+
+_NO_SPAN = nullcontext()
+
+
+class RefreshProfile:
+    def __init__(self) -> None:
+        self.profiler = cProfile.Profile()
+        self.spans: dict[str, float] = dict.fromkeys(SPAN_NAMES, 0.0)
+        self.total = 0.0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + perf_counter() - start
+
+    def summary(self) -> str:
+        lines = [f"Total: {self.total * 1000:.1f} ms"]
+        lines.extend(
+            f"{name}: {duration * 1000:.1f} ms" for name, duration in self.spans.items()
+        )
+        return "\n".join(lines)
+
+    def write(self, base_path: Path, top: int) -> tuple[Path, Path]:
+        stats_path = base_path.with_suffix(".prof")
+        summary_path = base_path.with_suffix(".txt")
+        self.profiler.dump_stats(stats_path)
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats("cumulative").print_stats(top)
+        summary_path.write_text(f"{self.summary()}\n\n{stream.getvalue()}", encoding="utf-8")
+        return stats_path, summary_path
+
+
+def span(profile: RefreshProfile | None, name: str) -> AbstractContextManager[None]:
+    if profile is None:
+        return _NO_SPAN
+    return profile.span(name)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_RATE_LIMITERS, DEFAULT_RATE_BURST, DEFAULT_RATE_LIMIT
+
+PRIORITY_REFRESH = 0
+PRIORITY_CALENDAR = 1
+PRIORITY_STATISTICS = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_REFRESH: "refresh",
+    PRIORITY_CALENDAR: "calendar",
+    PRIORITY_STATISTICS: "statistics",
+}
+
+# Share of the bucket that must remain available after a request of each priority.
+PRIORITY_RESERVES = {
+    PRIORITY_REFRESH: 0.0,
+    PRIORITY_CALENDAR: 0.25,
+    PRIORITY_STATISTICS: 0.5,
+}
+
+
+class HostNFlyRateLimiter:
+    """Token bucket shared by every entry of one host and account, at the strictest settings."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._granted = dict.fromkeys(PRIORITY_NAMES, 0)
+        self._throttled = dict.fromkeys(PRIORITY_NAMES, 0)
+        self._waited = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self._settings: dict[str, tuple[float, int]] = {}
+
+    def configure(self, entry_id: str, rate: float, burst: int) -> None:
+        self._settings[entry_id] = (rate, burst)
+        self._apply_settings()
+
+    def release(self, entry_id: str) -> bool:
+        self._settings.pop(entry_id, None)
+        if self._settings:
+            self._apply_settings()
+        return not self._settings
+
+    async def async_acquire(self, priority: int = PRIORITY_REFRESH) -> None:
+        started = None
+        while True:
+            self._refill()
+            floor = min(self._burst * PRIORITY_RESERVES.get(priority, 0.0), self._burst - 1)
+            missing = floor + 1 - self._tokens
+            if missing <= 0:
+                self._tokens -= 1
+                self._granted[priority] = self._granted.get(priority, 0) + 1
+                if started is not None:
+                    self._waited[priority] = (
+                        self._waited.get(priority, 0.0) + monotonic() - started
+                    )
+                return
+            if started is None:
+                started = monotonic()
+                self._throttled[priority] = self._throttled.get(priority, 0) + 1
+            await asyncio.sleep(missing * 60 / self._rate)
+
+    def usage(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "entries": len(self._settings),
+            "rate_per_minute": self._rate,
+            "burst": self._burst,
+            "available": round(self._tokens, 2),
+            "granted": {PRIORITY_NAMES[key]: value for key, value in self._granted.items()},
+            "throttled": {PRIORITY_NAMES[key]: value for key, value in self._throttled.items()},
+            "waited_seconds": {
+                PRIORITY_NAMES[key]: round(value, 2) for key, value in self._waited.items()
+            },
+        }
+
+    def _apply_settings(self) -> None:
+        self._refill()
+        self._rate = min(rate for rate, _ in self._settings.values())
+        self._burst = min(burst for _, burst in self._settings.values())
+        self._tokens = min(self._tokens, float(self._burst))
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._updated) * self._rate / 60
+        )
+        self._updated = now
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant, host: str, account: str) -> HostNFlyRateLimiter:
+    limiters: dict[tuple[str, str], HostNFlyRateLimiter] = hass.data.setdefault(
+        DATA_RATE_LIMITERS, {}
+    )
+    key = (host, account.lower())
+    limiter = limiters.get(key)
+    if limiter is None:
+        limiter = limiters[key] = HostNFlyRateLimiter(DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST)
+    return limiter
+
+
+@callback
+def async_release_rate_limiter(
+    hass: HomeAssistant, limiter: HostNFlyRateLimiter, entry_id: str
+) -> None:
+    if not limiter.release(entry_id):
+        return
+    limiters = hass.data.get(DATA_RATE_LIMITERS, {})
+    for key, registered in list(limiters.items()):
+        if registered is limiter:
+            del limiters[key]
+    if not limiters:
+        hass.data.pop(DATA_RATE_LIMITERS, None)
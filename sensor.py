@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .aggregates import PeriodStats
+from .const import DOMAIN, TURNOVER_HORIZON_DAYS
 from .coordinator import HostNFlyCoordinator
+from .entity import (
+    HostNFlyListingEntity,
+    HostNFlyPortfolioEntity,
+    async_add_listing_entities,
+)
+from .turnover import TurnoverWindow
 
 OCCUPANCY_SENSOR = SensorEntityDescription(
     key="occupancy",
@@ -41,12 +53,85 @@ CURRENT_GUEST_COUNT_SENSOR = SensorEntityDescription(
     icon="mdi:account-multiple",
 )
 
+NEXT_TURNOVER_SENSOR = SensorEntityDescription(
+    key="next_turnover",
+    name="Prochaine rotation",
+    icon="mdi:broom",
+    device_class=SensorDeviceClass.DATE,
+)
+
+SAME_DAY_TURNOVERS_SENSOR = SensorEntityDescription(
+    key="same_day_turnovers",
+    name=f"Rotations le jour même ({TURNOVER_HORIZON_DAYS} jours)",
+    icon="mdi:swap-horizontal",
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
 SENSOR_TYPES = (
     OCCUPANCY_SENSOR,
     CURRENT_GUEST_SENSOR,
     CURRENT_GUEST_COUNT_SENSOR,
     CURRENT_RESERVATION_SENSOR,
     NEXT_RESERVATION_SENSOR,
+    NEXT_TURNOVER_SENSOR,
+    SAME_DAY_TURNOVERS_SENSOR,
+)
+
+TURNOVERS_TODAY_SENSOR = SensorEntityDescription(
+    key="turnovers_today",
+    name="Rotations aujourd'hui",
+    icon="mdi:broom",
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
+TURNOVERS_TOMORROW_SENSOR = SensorEntityDescription(
+    key="turnovers_tomorrow",
+    name="Rotations demain",
+    icon="mdi:broom",
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
+PORTFOLIO_SENSOR_TYPES = (
+    TURNOVERS_TODAY_SENSOR,
+    TURNOVERS_TOMORROW_SENSOR,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HostNFlyStatsSensorDescription(SensorEntityDescription):
+    period: str
+    metric: str
+
+
+STATS_PERIOD_NAMES = {
+    "current_month": "mois en cours",
+    "next_30_days": "30 prochains jours",
+    "year_to_date": "depuis le 1er janvier",
+}
+
+STATS_SENSOR_TYPES = tuple(
+    description
+    for period, period_name in STATS_PERIOD_NAMES.items()
+    for description in (
+        HostNFlyStatsSensorDescription(
+            key=f"occupancy_rate_{period}",
+            name=f"Taux d'occupation ({period_name})",
+            icon="mdi:percent",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            period=period,
+            metric="occupancy_rate",
+        ),
+        HostNFlyStatsSensorDescription(
+            key=f"revenue_{period}",
+            name=f"Revenus ({period_name})",
+            icon="mdi:cash",
+            device_class=SensorDeviceClass.MONETARY,
+            native_unit_of_measurement="EUR",
+            period=period,
+            metric="revenue",
+        ),
+    )
 )
 
 
@@ -56,41 +141,31 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     coordinator: HostNFlyCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    entities: list[HostNFlySensor] = []
-    for listing_id in coordinator.data:
-        for description in SENSOR_TYPES:
-            entities.append(HostNFlySensor(coordinator, entry, listing_id, description))
-    async_add_entities(entities)
-
-
-class HostNFlySensor(CoordinatorEntity[HostNFlyCoordinator], SensorEntity):
-    def __init__(
-        self,
-        coordinator: HostNFlyCoordinator,
-        entry: ConfigEntry,
-        listing_id: str,
-        description: SensorEntityDescription,
-    ) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._listing_id = listing_id
-        self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_{listing_id}_{description.key}"
-        self._attr_has_entity_name = True
-        self._attr_name = description.name
-
-        listing = coordinator.data.get(listing_id, {}).get("listing", {})
-        listing_name = str(listing.get("name") or listing.get("title") or f"Listing {listing_id}")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, listing_id)},
-            name=listing_name,
-            manufacturer="HostNFly",
+
+    def _listing_sensors(listing_id: str) -> list[SensorEntity]:
+        entities: list[SensorEntity] = [
+            HostNFlySensor(coordinator, entry, listing_id, description)
+            for description in SENSOR_TYPES
+        ]
+        entities.extend(
+            HostNFlyStatsSensor(coordinator, entry, listing_id, description)
+            for description in STATS_SENSOR_TYPES
         )
+        return entities
 
-    @property
-    def _listing_data(self) -> dict[str, Any]:
-        return self.coordinator.data.get(self._listing_id, {})
+    portfolio_entities: list[SensorEntity] = [
+        HostNFlyPortfolioStatsSensor(coordinator, entry, description)
+        for description in STATS_SENSOR_TYPES
+    ]
+    portfolio_entities.extend(
+        HostNFlyPortfolioSensor(coordinator, entry, description)
+        for description in PORTFOLIO_SENSOR_TYPES
+    )
+    async_add_entities(portfolio_entities)
+    async_add_listing_entities(coordinator, entry, async_add_entities, _listing_sensors)
 
+
+class HostNFlySensor(HostNFlyListingEntity, SensorEntity):
     @property
     def native_value(self) -> Any:
         data = self._listing_data
@@ -110,10 +185,19 @@ class HostNFlySensor(CoordinatorEntity[HostNFlyCoordinator], SensorEntity):
             return _reservation_range(data.get("current_reservation"))
         if self.entity_description.key == "next_reservation":
             return _reservation_range(data.get("next_reservation"))
+        if self.entity_description.key == "next_turnover":
+            turnover = data.get("next_turnover")
+            if not turnover:
+                return None
+            return turnover.check_out
+        if self.entity_description.key == "same_day_turnovers":
+            return data.get("same_day_turnovers")
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
+        if self.entity_description.key == "next_turnover":
+            return _turnover_attributes(self._listing_data.get("next_turnover"))
         if self.entity_description.key not in {"current_guest", "current_reservation", "next_reservation"}:
             return None
         key = self.entity_description.key
@@ -141,6 +225,88 @@ class HostNFlySensor(CoordinatorEntity[HostNFlyCoordinator], SensorEntity):
         return attrs
 
 
+class HostNFlyStatsSensor(HostNFlyListingEntity, SensorEntity):
+    entity_description: HostNFlyStatsSensorDescription
+
+    @property
+    def _stats(self) -> PeriodStats | None:
+        return self._listing_data.get("stats", {}).get(self.entity_description.period)
+
+    @property
+    def native_value(self) -> Any:
+        return _stats_value(self._stats, self.entity_description.metric)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return _stats_attributes(self._stats)
+
+
+class HostNFlyPortfolioStatsSensor(HostNFlyPortfolioEntity, SensorEntity):
+    entity_description: HostNFlyStatsSensorDescription
+
+    @property
+    def _stats(self) -> PeriodStats | None:
+        return self.coordinator.portfolio_stats.get(self.entity_description.period)
+
+    @property
+    def native_value(self) -> Any:
+        return _stats_value(self._stats, self.entity_description.metric)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return _stats_attributes(self._stats)
+
+
+class HostNFlyPortfolioSensor(HostNFlyPortfolioEntity, SensorEntity):
+    @property
+    def _listing_ids(self) -> list[str]:
+        if self.entity_description.key == "turnovers_today":
+            return self.coordinator.portfolio_turnovers.get("today", [])
+        if self.entity_description.key == "turnovers_tomorrow":
+            return self.coordinator.portfolio_turnovers.get("tomorrow", [])
+        return []
+
+    @property
+    def native_value(self) -> Any:
+        return len(self._listing_ids)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return {"listing_ids": self._listing_ids}
+
+
+def _turnover_attributes(turnover: TurnoverWindow | None) -> dict[str, Any] | None:
+    if not turnover:
+        return None
+    return {
+        "check_out": turnover.check_out.isoformat(),
+        "check_in": turnover.check_in.isoformat() if turnover.check_in else None,
+        "gap_days": turnover.gap_days,
+        "same_day": turnover.same_day,
+    }
+
+
+def _stats_value(stats: PeriodStats | None, metric: str) -> Any:
+    if stats is None:
+        return None
+    if metric == "occupancy_rate":
+        return stats.occupancy_rate
+    if metric == "revenue":
+        return stats.revenue
+    return None
+
+
+def _stats_attributes(stats: PeriodStats | None) -> dict[str, Any] | None:
+    if stats is None:
+        return None
+    return {
+        "start_date": stats.start_date.isoformat(),
+        "end_date": stats.end_date.isoformat(),
+        "nights": stats.nights,
+        "occupied_nights": stats.occupied_nights,
+    }
+
+
 def _reservation_range(reservation: dict[str, Any] | None) -> str | None:
     if not reservation:
         return None
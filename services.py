@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_END_DATE,
+    ATTR_LISTING_ID,
+    ATTR_START_DATE,
+    ATTR_TOP,
+    DOMAIN,
+    PROFILE_TOP_DEFAULT,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_REFRESH,
+    TARGETED_REFRESH_DAYS,
+)
+from .coordinator import HostNFlyCoordinator
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_LISTING_ID): cv.string,
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TOP, default=PROFILE_TOP_DEFAULT): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        listing_id = call.data.get(ATTR_LISTING_ID)
+        today = dt_util.now().date()
+        start = call.data.get(ATTR_START_DATE, today)
+        end = call.data.get(ATTR_END_DATE, start + timedelta(days=TARGETED_REFRESH_DAYS))
+        if end < start:
+            raise HomeAssistantError("end_date doit être postérieure à start_date")
+
+        coordinators = _coordinators(hass)
+        if listing_id:
+            coordinators = [
+                coordinator for coordinator in coordinators if listing_id in coordinator.data
+            ]
+            if not coordinators:
+                raise HomeAssistantError(f"Logement inconnu: {listing_id}")
+        await asyncio.gather(
+            *(
+                coordinator.async_request_targeted_refresh(listing_id, start, end)
+                for coordinator in coordinators
+            )
+        )
+
+    async def _async_profile_refresh(call: ServiceCall) -> None:
+        top = call.data[ATTR_TOP]
+        reports: list[str] = []
+        for coordinator in _coordinators(hass):
+            try:
+                profile = await coordinator.async_profile_refresh()
+            except Exception as err:
+                raise HomeAssistantError(f"Erreur API HostNFly: {err}") from err
+            base_path = Path(
+                hass.config.path(
+                    f"{DOMAIN}_profile_{coordinator.entry.entry_id}_{dt_util.now():%Y%m%d_%H%M%S}"
+                )
+            )
+            stats_path, summary_path = await hass.async_add_executor_job(
+                profile.write, base_path, top
+            )
+            reports.append(
+                f"**{coordinator.entry.title}**\n\n{profile.summary()}\n\n"
+                f"{stats_path}\n{summary_path}"
+            )
+        reports.append(
+            "Les durées sont mesurées en temps réel et le profil cProfile couvre toute "
+            "la boucle d'événements : un rafraîchissement, un calendrier ou un import "
+            "de statistiques exécuté en parallèle est inclus dans ces chiffres."
+        )
+        persistent_notification.async_create(
+            hass,
+            "\n\n".join(reports),
+            title="HostNFly : profil du rafraîchissement",
+            notification_id=f"{DOMAIN}_profile_refresh",
+        )
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, _async_refresh, schema=REFRESH_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        _async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    if hass.data.get(DOMAIN):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE_REFRESH)
+
+
+def _coordinators(hass: HomeAssistant) -> list[HostNFlyCoordinator]:
+    return [runtime["coordinator"] for runtime in hass.data.get(DOMAIN, {}).values()]
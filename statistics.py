@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_BACKFILL_DAYS
+from .coordinator import HostNFlyCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class HostNFlyStatisticsImporter:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: HostNFlyCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._store = _statistics_store(hass, entry)
+        self._listings: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if stored:
+            self._listings = stored.get("listings", {})
+
+    async def async_import(self) -> None:
+        if self._lock.locked():
+            return
+        async with self._lock:
+            try:
+                await self._async_import()
+            except Exception as err:
+                _LOGGER.warning("Impossible d'importer les statistiques: %s", err)
+
+    async def _async_import(self) -> None:
+        end = dt_util.now().date()
+        backfill_start = end - timedelta(days=STATISTICS_BACKFILL_DAYS)
+        first_dates: dict[str, date] = {}
+        for listing_id in self._coordinator.data:
+            state = self._listings.get(listing_id)
+            first_date = (
+                date.fromisoformat(state["last_date"]) + timedelta(days=1)
+                if state
+                else backfill_start
+            )
+            if first_date < end:
+                first_dates[listing_id] = first_date
+        if not first_dates:
+            return
+
+        start = min(first_dates.values())
+        daily_values = await self._coordinator.async_get_daily_values(start, end)
+        for listing_id, first_date in first_dates.items():
+            values = daily_values.get(listing_id)
+            if values is None:
+                continue
+            self._import_listing(listing_id, first_date, values[(first_date - start).days :])
+        self._store.async_delay_save(lambda: {"listings": self._listings}, 1)
+
+    def _import_listing(
+        self,
+        listing_id: str,
+        first_date: date,
+        values: list[tuple[int, float]],
+    ) -> None:
+        state = self._listings.get(listing_id, {})
+        occupied_sum = int(state.get("occupied_sum", 0))
+        revenue_sum = float(state.get("revenue_sum", 0.0))
+        occupied_rows: list[StatisticData] = []
+        revenue_rows: list[StatisticData] = []
+        day = first_date
+        for occupied, revenue in values:
+            start = dt_util.start_of_local_day(day)
+            occupied_sum += occupied
+            revenue_sum = round(revenue_sum + revenue, 2)
+            occupied_rows.append(StatisticData(start=start, state=occupied, sum=occupied_sum))
+            revenue_rows.append(StatisticData(start=start, state=round(revenue, 2), sum=revenue_sum))
+            day += timedelta(days=1)
+        if not occupied_rows:
+            return
+
+        listing = self._coordinator.data.get(listing_id, {}).get("listing", {})
+        listing_name = str(listing.get("name") or listing.get("title") or f"Listing {listing_id}")
+        object_id = slugify(listing_id)
+        async_add_external_statistics(
+            self._hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{listing_name} nuits occupées",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:occupied_nights_{object_id}",
+                unit_of_measurement="nights",
+            ),
+            occupied_rows,
+        )
+        async_add_external_statistics(
+            self._hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{listing_name} revenus",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:revenue_{object_id}",
+                unit_of_measurement="EUR",
+            ),
+            revenue_rows,
+        )
+        self._listings[listing_id] = {
+            "last_date": (day - timedelta(days=1)).isoformat(),
+            "occupied_sum": occupied_sum,
+            "revenue_sum": revenue_sum,
+        }
+
+
+async def async_remove_statistics_store(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _statistics_store(hass, entry).async_remove()
+
+
+def _statistics_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics")
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date
+
+from .aggregates import IndexEntry
+
+
+@dataclass(frozen=True)
+class TurnoverWindow:
+    check_out: date
+    check_in: date | None
+
+    @property
+    def gap_days(self) -> int | None:
+        if self.check_in is None:
+            return None
+        return (self.check_in - self.check_out).days
+
+    @property
+    def same_day(self) -> bool:
+        return self.check_in == self.check_out
+
+
+class ListingTurnovers:
+    """Gaps between consecutive stays of one listing, from a single sorted sweep."""
+
+    def __init__(self, entries: list[IndexEntry]) -> None:
+        windows: list[TurnoverWindow] = []
+        occupied_until: date | None = None
+        for entry in sorted(entries, key=lambda item: item.start_date):
+            if occupied_until is not None and entry.start_date >= occupied_until:
+                windows.append(TurnoverWindow(occupied_until, entry.start_date))
+            if occupied_until is None or entry.end_date > occupied_until:
+                occupied_until = entry.end_date
+        if occupied_until is not None:
+            windows.append(TurnoverWindow(occupied_until, None))
+        self.windows = windows
+        self._check_outs = [window.check_out for window in windows]
+        self._check_ins = [window.check_in for window in windows if window.check_in is not None]
+        self._same_days = [window.check_out for window in windows if window.same_day]
+
+    def next_window(self, today: date) -> TurnoverWindow | None:
+        index = bisect_left(self._check_ins, today)
+        if index >= len(self.windows):
+            return None
+        window = self.windows[index]
+        if window.check_in is None and window.check_out < today:
+            return None
+        return window
+
+    def count(self, start: date, end: date) -> int:
+        return bisect_left(self._check_outs, end) - bisect_left(self._check_outs, start)
+
+    def same_day_count(self, start: date, end: date) -> int:
+        return bisect_left(self._same_days, end) - bisect_left(self._same_days, start)